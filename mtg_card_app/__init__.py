@@ -6,7 +6,15 @@ This package provides tools for searching MTG cards and building decks.
 
 __version__ = "0.1.0"
 
-# Make main functionality easily accessible
-from mtg_card_app import deck_builder, card_search
+import importlib
 
 __all__ = ["deck_builder", "card_search", "__version__"]
+
+_SUBMODULES = ("deck_builder", "card_search")
+
+
+def __getattr__(name):
+    """Import submodules on first access so each entry point loads only what it uses."""
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,6 +12,43 @@ import sys
 import argparse
 
 
+OVERVIEW = """\
+MTG Card App - An application for finding new MTG card combos
+
+Available modules:
+  - deck-builder: Build and manage MTG decks
+  - card-search: Search for MTG cards
+
+Run with -h for help or use a subcommand
+
+You can also run modules directly:
+  python -m mtg_card_app.deck_builder
+  python -m mtg_card_app.card_search
+
+Or use the installed scripts:
+  mtg-deck-builder
+  mtg-card-search"""
+
+
+def _run_submodule(submodule_main, remaining_args):
+    """Run a submodule's main() with the remaining command-line args.
+    
+    Args:
+        submodule_main: The submodule's main function
+        remaining_args: Arguments not consumed by the top-level parser
+        
+    Returns:
+        int: The submodule's exit code
+    """
+    # Replace sys.argv with remaining args for the submodule
+    original_argv = sys.argv
+    sys.argv = [sys.argv[0]] + remaining_args
+    try:
+        return submodule_main()
+    finally:
+        sys.argv = original_argv
+
+
 def main():
     """Main entry point for the MTG Card App."""
     parser = argparse.ArgumentParser(
@@ -47,34 +84,12 @@ def main():
     
     if args.command == "deck-builder":
         from mtg_card_app.deck_builder.__main__ import main as deck_main
-        # Replace sys.argv with remaining args for the submodule
-        import sys
-        original_argv = sys.argv
-        sys.argv = [sys.argv[0]] + remaining_args
-        result = deck_main()
-        sys.argv = original_argv
-        return result
+        return _run_submodule(deck_main, remaining_args)
     elif args.command == "card-search":
         from mtg_card_app.card_search.__main__ import main as search_main
-        # Replace sys.argv with remaining args for the submodule
-        import sys
-        original_argv = sys.argv
-        sys.argv = [sys.argv[0]] + remaining_args
-        result = search_main()
-        sys.argv = original_argv
-        return result
+        return _run_submodule(search_main, remaining_args)
     else:
-        print("MTG Card App - An application for finding new MTG card combos")
-        print("\nAvailable modules:")
-        print("  - deck-builder: Build and manage MTG decks")
-        print("  - card-search: Search for MTG cards")
-        print("\nRun with -h for help or use a subcommand")
-        print("\nYou can also run modules directly:")
-        print("  python -m mtg_card_app.deck_builder")
-        print("  python -m mtg_card_app.card_search")
-        print("\nOr use the installed scripts:")
-        print("  mtg-deck-builder")
-        print("  mtg-card-search")
+        print(OVERVIEW)
         return 0
     
     return 0
@@ -4,6 +4,8 @@ Card Search Module
 This module provides functionality for searching MTG cards.
 """
 
+import functools
+
 __all__ = ["CardSearch", "search_by_name", "search_by_color"]
 
 
@@ -28,6 +30,11 @@ class CardSearch:
     def __init__(self):
         """Initialize the card search."""
         self.cards = self.MOCK_CARDS
+        # Lowercase the searchable fields once so queries don't redo it per card
+        self._index = [
+            (card, card["name"].lower(), card["color"].lower(), card["type"].lower())
+            for card in self.cards
+        ]
     
     def search_by_name(self, query):
         """Search for cards by name.
@@ -40,8 +47,8 @@ class CardSearch:
         """
         query_lower = query.lower()
         return [
-            card for card in self.cards
-            if query_lower in card["name"].lower()
+            card for card, name, _, _ in self._index
+            if query_lower in name
         ]
     
     def search_by_color(self, color):
@@ -55,8 +62,8 @@ class CardSearch:
         """
         color_lower = color.lower()
         return [
-            card for card in self.cards
-            if color_lower in card["color"].lower()
+            card for card, _, card_color, _ in self._index
+            if color_lower in card_color
         ]
     
     def search_by_type(self, card_type):
@@ -70,8 +77,8 @@ class CardSearch:
         """
         type_lower = card_type.lower()
         return [
-            card for card in self.cards
-            if type_lower in card["type"].lower()
+            card for card, _, _, type_line in self._index
+            if type_lower in type_line
         ]
     
     def print_results(self, results):
@@ -84,11 +91,20 @@ class CardSearch:
             print("No cards found")
             return
         
-        print(f"\nFound {len(results)} card(s):")
-        print("-" * 60)
-        for card in results:
-            print(f"{card['name']:<30} {card['color']:<12} {card['type']:<15} CMC: {card['cmc']}")
-        print("-" * 60)
+        rule = "-" * 60
+        lines = [f"\nFound {len(results)} card(s):", rule]
+        lines.extend(
+            f"{card['name']:<30} {card['color']:<12} {card['type']:<15} CMC: {card['cmc']}"
+            for card in results
+        )
+        lines.append(rule)
+        print("\n".join(lines))
+
+
+@functools.lru_cache(maxsize=1)
+def _default_searcher():
+    """Return the CardSearch instance shared by the module-level helpers."""
+    return CardSearch()
 
 
 def search_by_name(query):
@@ -100,8 +116,7 @@ def search_by_name(query):
     Returns:
         list: List of matching cards
     """
-    searcher = CardSearch()
-    return searcher.search_by_name(query)
+    return _default_searcher().search_by_name(query)
 
 
 def search_by_color(color):
@@ -113,5 +128,4 @@ def search_by_color(color):
     Returns:
         list: List of matching cards
     """
-    searcher = CardSearch()
-    return searcher.search_by_color(color)
+    return _default_searcher().search_by_color(color)
@@ -13,6 +13,24 @@ import argparse
 from mtg_card_app.card_search import CardSearch
 
 
+# Searchable fields: (argument/command name, CardSearch method, CLI heading)
+SEARCH_FIELDS = (
+    ("name", "search_by_name", "\nSearching for cards with name containing '{}':"),
+    ("color", "search_by_color", "\nSearching for {} cards:"),
+    ("type", "search_by_type", "\nSearching for {} cards:"),
+)
+
+INTERACTIVE_HELP = """
+Card Search - Interactive Mode
+
+Commands:
+  name <query> - Search by card name
+  color <color> - Search by color
+  type <type> - Search by card type
+  quit - Exit the search tool
+"""
+
+
 def main():
     """Main entry point for the card search module."""
     parser = argparse.ArgumentParser(
@@ -45,13 +63,12 @@ def main():
     searcher = CardSearch()
     
     if args.interactive:
-        print("\nCard Search - Interactive Mode")
-        print("\nCommands:")
-        print("  name <query> - Search by card name")
-        print("  color <color> - Search by color")
-        print("  type <type> - Search by card type")
-        print("  quit - Exit the search tool")
-        print()
+        print(INTERACTIVE_HELP)
+        
+        search_commands = {
+            field: getattr(searcher, method_name)
+            for field, method_name, _ in SEARCH_FIELDS
+        }
         
         while True:
             try:
@@ -65,14 +82,8 @@ def main():
                 if cmd == "quit":
                     print("Goodbye!")
                     break
-                elif cmd == "name" and len(parts) == 2:
-                    results = searcher.search_by_name(parts[1])
-                    searcher.print_results(results)
-                elif cmd == "color" and len(parts) == 2:
-                    results = searcher.search_by_color(parts[1])
-                    searcher.print_results(results)
-                elif cmd == "type" and len(parts) == 2:
-                    results = searcher.search_by_type(parts[1])
+                elif cmd in search_commands and len(parts) == 2:
+                    results = search_commands[cmd](parts[1])
                     searcher.print_results(results)
                 else:
                     print("Unknown command. Try 'name', 'color', 'type', or 'quit'")
@@ -85,23 +96,13 @@ def main():
         # Command-line search mode
         found_results = False
         
-        if args.name:
-            results = searcher.search_by_name(args.name)
-            print(f"\nSearching for cards with name containing '{args.name}':")
-            searcher.print_results(results)
-            found_results = True
-        
-        if args.color:
-            results = searcher.search_by_color(args.color)
-            print(f"\nSearching for {args.color} cards:")
-            searcher.print_results(results)
-            found_results = True
-        
-        if args.type:
-            results = searcher.search_by_type(args.type)
-            print(f"\nSearching for {args.type} cards:")
-            searcher.print_results(results)
-            found_results = True
+        for field, method_name, heading in SEARCH_FIELDS:
+            value = getattr(args, field)
+            if value:
+                results = getattr(searcher, method_name)(value)
+                print(heading.format(value))
+                searcher.print_results(results)
+                found_results = True
         
         if not found_results:
             # Example usage
@@ -35,14 +35,12 @@ class DeckBuilder:
             print(f"{self.name} is empty")
             return
         
-        print(f"\n{self.name}:")
-        print("-" * 40)
-        total = 0
-        for card in self.cards:
-            print(f"{card['quantity']}x {card['name']}")
-            total += card['quantity']
-        print("-" * 40)
-        print(f"Total cards: {total}")
+        rule = "-" * 40
+        lines = [f"\n{self.name}:", rule]
+        lines.extend(f"{card['quantity']}x {card['name']}" for card in self.cards)
+        lines.append(rule)
+        lines.append(f"Total cards: {self.get_card_count()}")
+        print("\n".join(lines))
     
     def get_card_count(self):
         """Get the total number of cards in the deck."""
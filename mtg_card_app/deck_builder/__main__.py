@@ -13,6 +13,17 @@ import argparse
 from mtg_card_app.deck_builder import DeckBuilder
 
 
+INTERACTIVE_HELP = """
+Deck Builder - Interactive Mode
+Building deck: {name}
+
+Commands:
+  add <card_name> [quantity] - Add a card to the deck
+  list - List all cards in the deck
+  quit - Exit the deck builder
+"""
+
+
 def main():
     """Main entry point for the deck builder module."""
     parser = argparse.ArgumentParser(
@@ -37,13 +48,7 @@ def main():
     deck = DeckBuilder(args.name)
     
     if args.interactive:
-        print(f"\nDeck Builder - Interactive Mode")
-        print(f"Building deck: {args.name}")
-        print("\nCommands:")
-        print("  add <card_name> [quantity] - Add a card to the deck")
-        print("  list - List all cards in the deck")
-        print("  quit - Exit the deck builder")
-        print()
+        print(INTERACTIVE_HELP.format(name=args.name))
         
         while True:
             try:
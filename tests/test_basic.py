@@ -16,6 +16,15 @@ def test_package_import():
     assert "card_search" in mtg_card_app.__all__
 
 
+def test_package_lazy_submodules():
+    """Test that submodules are reachable as attributes of the package."""
+    import mtg_card_app
+    assert mtg_card_app.deck_builder.DeckBuilder is not None
+    assert mtg_card_app.card_search.CardSearch is not None
+    with pytest.raises(AttributeError):
+        mtg_card_app.not_a_module
+
+
 def test_deck_builder_import():
     """Test that the deck_builder module can be imported."""
     from mtg_card_app.deck_builder import DeckBuilder, create_deck
@@ -89,6 +98,31 @@ def test_card_search_helper_functions():
     assert len(blue_cards) >= 1
 
 
+def test_card_search_helpers_share_searcher():
+    """Test that the helper functions reuse a single CardSearch instance."""
+    from mtg_card_app.card_search import _default_searcher, search_by_name
+    
+    searcher = _default_searcher()
+    assert _default_searcher() is searcher
+    assert search_by_name("bolt") == searcher.search_by_name("bolt")
+
+
+def test_run_submodule_restores_argv():
+    """Test that subcommand dispatch passes remaining args and restores sys.argv."""
+    from mtg_card_app.__main__ import _run_submodule
+    
+    original_argv = sys.argv
+    seen = []
+    
+    def fake_main():
+        seen.append(list(sys.argv[1:]))
+        return 0
+    
+    assert _run_submodule(fake_main, ["--name", "bolt"]) == 0
+    assert seen == [["--name", "bolt"]]
+    assert sys.argv is original_argv
+
+
 if __name__ == "__main__":
     # Run tests if executed directly
     pytest.main([__file__, "-v"])